@@ -0,0 +1,79 @@
+"""
+core/_client.py
+===============
+Shared OpenAI client setup for every module that calls the API.
+
+`.env` is loaded once here (load_dotenv walks the filesystem on every call),
+and the sync/async clients are built on first use and reused by every module
+(chat and embeddings alike), so all requests share one keep-alive (HTTP/2)
+connection pool. `openai` and `httpx` are imported on first use, keeping them
+off the offline/mock paths.
+
+An async connection pool is bound to the event loop it was first used on, so
+async clients are cached per running loop (each asyncio.run() gets its own);
+close_async_client() releases the current loop's client before the loop ends.
+"""
+
+from functools import lru_cache
+from typing import TYPE_CHECKING, Optional
+import asyncio
+import os
+import weakref
+from dotenv import load_dotenv
+
+if TYPE_CHECKING:
+    from openai import AsyncOpenAI, OpenAI
+
+# Load API Key from .env (once per process)
+load_dotenv()
+
+
+def get_api_key() -> Optional[str]:
+    return os.getenv("OPENAI_API_KEY")
+
+
+@lru_cache(maxsize=1)
+def get_client() -> "OpenAI":
+    """Process-wide sync client; requests after the first skip the TCP+TLS handshake."""
+    import httpx
+    from openai import OpenAI, DefaultHttpxClient
+
+    return OpenAI(
+        api_key=get_api_key(),
+        http_client=DefaultHttpxClient(
+            http2=True,
+            limits=httpx.Limits(max_keepalive_connections=32, max_connections=64),
+            timeout=30.0,
+        ),
+    )
+
+
+_async_clients: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, AsyncOpenAI]" = (
+    weakref.WeakKeyDictionary()
+)
+
+
+def get_async_client() -> "AsyncOpenAI":
+    """
+    Async client for concurrent calls on the running event loop (one pooled
+    HTTP client per loop). Must be called from inside a coroutine.
+    """
+    loop = asyncio.get_running_loop()
+    client = _async_clients.get(loop)
+    if client is None:
+        import httpx
+        from openai import AsyncOpenAI, DefaultAsyncHttpxClient
+
+        client = AsyncOpenAI(
+            api_key=get_api_key(),
+            http_client=DefaultAsyncHttpxClient(limits=httpx.Limits(max_connections=100)),
+        )
+        _async_clients[loop] = client
+    return client
+
+
+async def close_async_client() -> None:
+    """Close and forget the running loop's async client, if one was created."""
+    client = _async_clients.pop(asyncio.get_running_loop(), None)
+    if client is not None:
+        await client.close()
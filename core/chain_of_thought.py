@@ -6,7 +6,31 @@ This technique guides the AI to reason step-by-step
 before producing a final answer.
 """
 
-import prompting
+import os
+import sys
+
+# Ensure local imports work when executed as a script from project root
+CURRENT_DIR = os.path.dirname(os.path.abspath(__file__))
+if CURRENT_DIR not in sys.path:
+    sys.path.insert(0, CURRENT_DIR)
+
+try:
+    # Package import
+    from . import prompting  # type: ignore
+except Exception:
+    # Script import
+    import prompting  # type: ignore
+
+# Explicitly tell AI to show reasoning steps
+_COT_WITH_REASONING = (
+    "You are CryptoInsightAI. Think through the problem step-by-step, "
+    "explain your reasoning clearly, and then provide the final answer."
+)
+# Instruct AI to think internally (hidden reasoning)
+_COT_WITHOUT_REASONING = (
+    "You are CryptoInsightAI. Think carefully step-by-step internally, "
+    "but only output the final answer without showing your reasoning."
+)
 
 
 def chain_of_thought_prompt(user_question: str, show_reasoning: bool = True):
@@ -17,19 +41,7 @@ def chain_of_thought_prompt(user_question: str, show_reasoning: bool = True):
     :param show_reasoning: bool - Whether to display reasoning in the final answer.
     :return: str - AI response
     """
-    if show_reasoning:
-        # Explicitly tell AI to show reasoning steps
-        system_prompt = (
-            "You are CryptoInsightAI. Think through the problem step-by-step, "
-            "explain your reasoning clearly, and then provide the final answer."
-        )
-    else:
-        # Instruct AI to think internally (hidden reasoning)
-        system_prompt = (
-            "You are CryptoInsightAI. Think carefully step-by-step internally, "
-            "but only output the final answer without showing your reasoning."
-        )
-
+    system_prompt = _COT_WITH_REASONING if show_reasoning else _COT_WITHOUT_REASONING
     return prompting.system_user_prompt(system_prompt, user_question)
 
 
@@ -6,6 +6,7 @@ Builds prompts at runtime using memory (chat history), retrieved docs (like RAG)
 and system instructions.
 """
 
+import io
 import os
 import sys
 
@@ -21,6 +22,14 @@ except Exception:
     # When run as a standalone script
     from zero_shot_prompting import zero_shot_answer  # type: ignore
 
+# System persona, kept byte-identical across calls so every prompt shares the same prefix
+_SYSTEM_PREFIX = (
+    "System: You are CryptoInsightAI, an expert assistant in cryptocurrencies, "
+    "blockchains, and digital assets. "
+    "Provide concise, factually correct answers with helpful explanations. "
+    "Cite credible sources or context when relevant."
+)
+
 def build_dynamic_prompt(
     user_query: str,
     conversation_history=None,
@@ -35,38 +44,33 @@ def build_dynamic_prompt(
     :param output_format: str - Desired output format (JSON, Markdown, etc.)
     :return: str - Final constructed prompt.
     """
-    prompt_parts = []
+    buf = io.StringIO()
 
     # 1. System persona
-    system_instructions = (
-        "You are CryptoInsightAI, an expert assistant in cryptocurrencies, "
-        "blockchains, and digital assets. "
-        "Provide concise, factually correct answers with helpful explanations. "
-        "Cite credible sources or context when relevant."
-    )
-    prompt_parts.append(f"System: {system_instructions}")
+    buf.write(_SYSTEM_PREFIX)
 
     # 2. Conversation history
     if conversation_history:
-        history_str = ""
-        for turn in conversation_history:
-            history_str += f"User: {turn['user']}\nAssistant: {turn['assistant']}\n"
-        prompt_parts.append(f"Conversation History:\n{history_str.strip()}")
+        history_str = "\n".join(
+            f"User: {turn['user']}\nAssistant: {turn['assistant']}" for turn in conversation_history
+        )
+        buf.write("\n\nConversation History:\n")
+        buf.write(history_str.strip())
 
     # 3. Retrieved context (from live APIs or RAG)
     if retrieved_context:
-        prompt_parts.append(f"Additional Context:\n{retrieved_context}")
+        buf.write("\n\nAdditional Context:\n")
+        buf.write(retrieved_context)
 
     # 4. Output formatting
     if output_format:
-        prompt_parts.append(f"Please respond in {output_format} format.")
+        buf.write(f"\n\nPlease respond in {output_format} format.")
 
     # 5. Current user query
-    prompt_parts.append(f"User: {user_query}")
+    buf.write("\n\nUser: ")
+    buf.write(user_query)
 
-    # Combine into one string
-    final_prompt = "\n\n".join(prompt_parts)
-    return final_prompt
+    return buf.getvalue()
 
 
 # Simple test run
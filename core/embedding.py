@@ -10,39 +10,107 @@ You can use these embeddings for:
 - Semantic search
 - Document similarity
 - Retrieval Augmented Generation (RAG) pipeline
+
+Embeddings are cached on disk (if `diskcache` is installed), keyed by a hash
+of model + text, so repeated texts skip the API round-trip.
 """
 
+from typing import List, Optional
 import os
-from dotenv import load_dotenv
-from openai import OpenAI
+import sys
+import hashlib
+import numpy as np
+
+try:
+    import diskcache  # type: ignore
+except ImportError:
+    diskcache = None  # type: ignore
+
+# Ensure local imports work when executed as a script from project root
+CURRENT_DIR = os.path.dirname(os.path.abspath(__file__))
+if CURRENT_DIR not in sys.path:
+    sys.path.insert(0, CURRENT_DIR)
+
+try:
+    # Package import
+    from ._client import get_api_key, get_client  # type: ignore
+except Exception:
+    # Script import
+    from _client import get_api_key, get_client  # type: ignore
 
-# Load API key from .env
-load_dotenv()
-OPENAI_API_KEY = os.getenv("OPENAI_API_KEY")
 OPENAI_EMBEDDING_MODEL = os.getenv("OPENAI_EMBEDDING_MODEL", "text-embedding-3-small")
+EMBEDDING_CACHE_DIR = os.getenv("EMBEDDING_CACHE_DIR", ".embedding_cache")
+EMBEDDING_CACHE_SIZE_LIMIT = 1 << 30  # 1 GB, least-recently-used entries evicted first
+
+_cache = None
+
+
+def _get_cache():
+    global _cache
+    if _cache is None and diskcache is not None:
+        _cache = diskcache.Cache(
+            EMBEDDING_CACHE_DIR,
+            size_limit=EMBEDDING_CACHE_SIZE_LIMIT,
+            eviction_policy="least-recently-used",
+        )
+    return _cache
+
 
+def _cache_key(text: str) -> str:
+    return hashlib.sha256(f"{OPENAI_EMBEDDING_MODEL}:{text}".encode("utf-8")).hexdigest()
 
-def generate_embedding(text: str):
+
+def generate_embedding(text: str) -> np.ndarray:
     """
     Generate an embedding vector for the input text using the OpenAI embedding model.
-    Returns a list of floats.
+    Returns a float32 numpy array.
+    """
+    return generate_embeddings_batch([text])[0]
+
+
+def generate_embeddings_batch(texts: List[str], batch_size: int = 512) -> List[np.ndarray]:
     """
-    if not OPENAI_API_KEY:
+    Generate embeddings for many texts with as few API calls as possible.
+    Cached texts are served locally; the rest are sent `batch_size` at a time
+    (the embeddings endpoint accepts a list of inputs per request).
+    Returns float32 numpy arrays in the same order as `texts`.
+    """
+    if not get_api_key():
         raise ValueError("❌ OPENAI_API_KEY not found in environment variables.")
 
-    client = OpenAI(api_key=OPENAI_API_KEY)
-    try:
-        resp = client.embeddings.create(
-            model=OPENAI_EMBEDDING_MODEL,
-            input=text,
-        )
-    except Exception as e:
-        raise Exception(f"❌ Embedding API call failed: {e}") from e
+    cache = _get_cache()
+    results: List[Optional[np.ndarray]] = [None] * len(texts)
+    missing: List[int] = []
+    for i, text in enumerate(texts):
+        blob = cache.get(_cache_key(text)) if cache is not None else None
+        if blob is not None:
+            # Copy: frombuffer views the cached bytes read-only, while a miss returns
+            # a writable array, and callers may normalize in place either way
+            results[i] = np.frombuffer(blob, dtype=np.float32).copy()
+        else:
+            missing.append(i)
+
+    for start in range(0, len(missing), batch_size):
+        idxs = missing[start:start + batch_size]
+        try:
+            resp = get_client().embeddings.create(
+                model=OPENAI_EMBEDDING_MODEL,
+                input=[texts[i] for i in idxs],
+            )
+        except Exception as e:
+            raise Exception(f"❌ Embedding API call failed: {e}") from e
+
+        if not resp.data or len(resp.data) != len(idxs):
+            raise Exception("❌ No embedding returned from OpenAI.")
 
-    if not resp.data or not resp.data[0].embedding:
-        raise Exception("❌ No embedding returned from OpenAI.")
+        for item in resp.data:
+            i = idxs[item.index]
+            emb = np.asarray(item.embedding, dtype=np.float32)
+            results[i] = emb
+            if cache is not None:
+                cache.set(_cache_key(texts[i]), emb.tobytes())
 
-    return resp.data[0].embedding
+    return results
 
 
 if __name__ == "__main__":
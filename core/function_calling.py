@@ -9,8 +9,83 @@ allowing the assistant to perform actions like sending emails,
 adding tasks, retrieving data, or controlling external services.
 """
 
-import datetime
-import pytz
+import time
+from datetime import datetime, timedelta
+from zoneinfo import ZoneInfo, ZoneInfoNotFoundError
+
+
+_DATE_FMT = "%A, %B %d, %Y"
+_TIME_FMT = "%Y-%m-%d %H:%M:%S"
+
+# (expiry timestamp, formatted date): the date string only changes at local midnight
+_date_cache = (0.0, "")
+
+
+def _today() -> str:
+    global _date_cache
+    if time.time() < _date_cache[0]:
+        return _date_cache[1]
+    now = datetime.now()
+    midnight = datetime.combine(now.date() + timedelta(days=1), datetime.min.time())
+    _date_cache = (midnight.timestamp(), now.strftime(_DATE_FMT))
+    return _date_cache[1]
+
+
+# ---- CURRENT DATE ----
+def _act_get_date(params):
+    today = _today()
+    print(f"[Action] Retrieved system date: {today}")
+    return f"📅 Today is {today}."
+
+
+# ---- CURRENT TIME ----
+def _act_get_time(params):
+    # Local time by default; pass params["timezone"] (e.g. "UTC") for a specific zone
+    tz_name = (params or {}).get("timezone")
+    try:
+        tz = ZoneInfo(tz_name) if tz_name else None
+    except (ZoneInfoNotFoundError, ValueError):
+        print(f"[Error] Unknown timezone: {tz_name}")
+        return f"❌ Sorry, I don't recognize the timezone '{tz_name}'."
+    now = datetime.now(tz=tz).strftime(_TIME_FMT)
+    print(f"[Action] Retrieved system time: {now}")
+    return f"⏰ Current time: {now}"
+
+
+# ---- EMAIL SENDING ----
+def _act_send_email(params):
+    to = params.get("to", "unknown recipient")
+    subject = params.get("subject", "No Subject")
+    body = params.get("body", "")
+    # Simulated action (replace with real email API integration)
+    print(f"[Action] Sending email to {to} | Subject: '{subject}' | Body: {body}")
+    return f"✅ Email sent to {to} with subject '{subject}'."
+
+
+# ---- ADD TO-DO TASK ----
+def _act_add_todo(params):
+    task = params.get("task", "Unnamed task")
+    # Simulated action (replace with real to-do system integration)
+    print(f"[Action] Adding task to to-do list: {task}")
+    return f"📝 Task '{task}' added to your to-do list."
+
+
+# ---- WEATHER INFORMATION ----
+def _act_weather(params):
+    location = params.get("location", "your area")
+    # Simulated response (replace with actual weather API call)
+    print(f"[Action] Fetching weather for {location}")
+    return f"☀ The weather in {location} is sunny and warm today."
+
+
+# Action name -> handler; looked up once per call instead of an if/elif ladder
+_ACTIONS = {
+    "get_date": _act_get_date,
+    "get_time": _act_get_time,
+    "send_email": _act_send_email,
+    "add_todo": _act_add_todo,
+    "weather": _act_weather,
+}
 
 
 def execute_action(action_name, params):
@@ -21,47 +96,12 @@ def execute_action(action_name, params):
     :param params: Dictionary of parameters for the action.
     :return: String result message.
     """
-
-    # ---- CURRENT DATE ----
-    if action_name == "get_date":
-        today = datetime.datetime.now().strftime("%A, %B %d, %Y")
-        print(f"[Action] Retrieved system date: {today}")
-        return f"📅 Today is {today}."
-
-    # ---- CURRENT TIME ----
-    elif action_name == "get_time":
-        # Returns current time (could be timezone-aware)
-        now = datetime.datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-        print(f"[Action] Retrieved system time: {now}")
-        return f"⏰ Current time: {now}"
-
-    # ---- EMAIL SENDING ----
-    elif action_name == "send_email":
-        to = params.get("to", "unknown recipient")
-        subject = params.get("subject", "No Subject")
-        body = params.get("body", "")
-        # Simulated action (replace with real email API integration)
-        print(f"[Action] Sending email to {to} | Subject: '{subject}' | Body: {body}")
-        return f"✅ Email sent to {to} with subject '{subject}'."
-
-    # ---- ADD TO-DO TASK ----
-    elif action_name == "add_todo":
-        task = params.get("task", "Unnamed task")
-        # Simulated action (replace with real to-do system integration)
-        print(f"[Action] Adding task to to-do list: {task}")
-        return f"📝 Task '{task}' added to your to-do list."
-
-    # ---- WEATHER INFORMATION ----
-    elif action_name == "weather":
-        location = params.get("location", "your area")
-        # Simulated response (replace with actual weather API call)
-        print(f"[Action] Fetching weather for {location}")
-        return f"☀ The weather in {location} is sunny and warm today."
-
-    # ---- FALLBACK ----
-    else:
+    handler = _ACTIONS.get(action_name)
+    if handler is None:
+        # ---- FALLBACK ----
         print(f"[Error] Unknown action: {action_name}")
         return "❌ Sorry, I don't recognize that action."
+    return handler(params)
 
 
 # Standalone test cases
@@ -82,6 +122,8 @@ if __name__ == "__main__":
 
     print(execute_action("get_time", {}))
 
+    print(execute_action("get_time", {"timezone": "UTC"}))
+
     print(execute_action("get_date", {}))
 
     print(execute_action("unknown_action", {}))
@@ -0,0 +1,51 @@
+"""
+core/hash_embedding.py
+======================
+Deterministic pseudo-embeddings for running the demos offline.
+
+A text is hashed (SHA-256) into a 64-bit seed, which drives a 64-bit LCG
+(Knuth's MMIX constants). Instead of stepping the generator in a Python loop,
+the i-th state is computed directly as `A_i * seed + C_i (mod 2**64)` from
+precomputed jump tables, so a whole vector is one vectorized NumPy expression.
+"""
+
+import hashlib
+from functools import lru_cache
+import numpy as np
+
+_LCG_MUL = 6364136223846793005
+_LCG_INC = 1442695040888963407
+_MASK64 = (1 << 64) - 1
+
+
+@lru_cache(maxsize=None)
+def _lcg_tables(n: int):
+    """Jump tables so that state_i = mul[i] * seed + inc[i] (uint64 wraparound)."""
+    mul = np.empty(n, dtype=np.uint64)
+    inc = np.empty(n, dtype=np.uint64)
+    a, c = 1, 0
+    for i in range(n):
+        a = (a * _LCG_MUL) & _MASK64
+        c = (c * _LCG_MUL + _LCG_INC) & _MASK64
+        mul[i] = a
+        inc[i] = c
+    return mul, inc
+
+
+def _det_vec(seed: int, n: int) -> np.ndarray:
+    """n float32 values in [-1, 1) from the top 24 bits of each LCG state."""
+    mul, inc = _lcg_tables(n)
+    states = mul * np.uint64(seed) + inc
+    return (states >> np.uint64(40)).astype(np.float32) * np.float32(2.0 / (1 << 24)) - np.float32(1.0)
+
+
+@lru_cache(maxsize=4096)
+def hash_embedding(text: str, dim: int = 128) -> np.ndarray:
+    """
+    Return a deterministic float32 pseudo-embedding for `text`.
+    Results are memoized and shared, so the returned array is read-only.
+    """
+    h = hashlib.sha256(text.encode("utf-8")).hexdigest()
+    vec = _det_vec(int(h[:16], 16), dim)
+    vec.setflags(write=False)
+    return vec
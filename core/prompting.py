@@ -1,6 +1,9 @@
 # core/prompting.py
 from typing import Optional, Dict
 
+# System role line shared by every zero-shot prompt (constant prefix)
+_SYS_ROLE = "SYSTEM: You are CryptoInsiteAI — a concise, accurate crypto assistant."
+
 def system_user_prompt(system_prompt: str, user_question: str) -> Dict[str, str]:
     """
     Minimal wrapper returning prompt components as a dict.
@@ -18,10 +21,8 @@ def build_zero_shot_prompt(task_instruction: str,
 
     Zero-shot = no examples / no few-shot context.
     """
-    pieces = []
     # System / role
-    pieces.append(f"SYSTEM: You are CryptoInsiteAI — a concise, accurate crypto assistant.\n"
-                  f"Task instruction: {task_instruction}")
+    pieces = [f"{_SYS_ROLE}\nTask instruction: {task_instruction}"]
 
     # Optional constraints
     if constraints:
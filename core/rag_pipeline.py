@@ -11,15 +11,20 @@ Pipeline:
 5) Get the final answer from the LLM (mock/OpenAI via zero_shot_answer).
 
 Expected vector_store interface (see core/vector_store.py you will create):
-- add_document_embedding(embedding: List[float], metadata: Dict) -> None
-- search_similar(query_embedding: List[float], top_k: int) -> List[Dict]:
+- add_document_embedding(embedding: List[float], metadata: Dict, normalized: bool = False) -> None
+- search_similar(query_embedding: List[float], top_k: int, query_is_normalized: bool = False) -> List[Dict]:
     each result: {"score": float, "metadata": {...}}
 - clear() -> None   (optional utility)
 """
 
+from collections import OrderedDict
 from typing import List, Dict, Optional
+import asyncio
+import hashlib
+import io
 import os
 import sys
+import numpy as np
 
 # Ensure local imports work when executed as a script from project root
 CURRENT_DIR = os.path.dirname(os.path.abspath(__file__))
@@ -28,14 +33,30 @@ if CURRENT_DIR not in sys.path:
 
 try:
     # Package imports
-    from . import embedding as embeddings  # type: ignore
     from . import dynamic_prompting  # type: ignore
-    from .zero_shot_prompting import zero_shot_answer  # type: ignore
+    from .hash_embedding import hash_embedding  # type: ignore
+    from .zero_shot_prompting import is_fallback_answer, zero_shot_answer  # type: ignore
 except Exception:
     # Script imports
-    import embedding as embeddings  # type: ignore
     import dynamic_prompting  # type: ignore
-    from zero_shot_prompting import zero_shot_answer  # type: ignore
+    from hash_embedding import hash_embedding  # type: ignore
+    from zero_shot_prompting import is_fallback_answer, zero_shot_answer  # type: ignore
+
+# LRU cache of {"prompt", "answer"} results keyed by a hash of the final prompt
+ANSWER_CACHE_SIZE = 512
+_answer_cache: "OrderedDict[str, Dict[str, str]]" = OrderedDict()
+
+
+def _embeddings():
+    """
+    Import the OpenAI-backed embedding module on first use; it pulls in the
+    openai SDK, which offline runs never need.
+    """
+    try:
+        from . import embedding  # type: ignore
+    except Exception:
+        import embedding  # type: ignore
+    return embedding
 
 
 def add_document(
@@ -56,54 +77,124 @@ def add_document(
     except Exception:
         import vector_store  # type: ignore
 
-    emb = embeddings.generate_embedding(text)
+    emb = _normalize(_embeddings().generate_embedding(text))
     meta = {"id": doc_id, "source": source, "content": text}
     if extra_meta:
         meta.update(extra_meta)
-    vector_store.add_document_embedding(emb, meta)
+    vector_store.add_document_embedding(emb, meta, normalized=True)
 
 
-def _format_source_list(results: List[Dict]) -> str:
+def add_documents(
+    texts: List[str],
+    doc_ids: Optional[List[Optional[str]]] = None,
+    sources: Optional[List[Optional[str]]] = None,
+    extra_metas: Optional[List[Optional[Dict]]] = None,
+    batch_size: int = 512,
+    max_concurrency: int = 5,
+):
     """
-    Build a 'Sources' block with [n] markers, deduped by (source, id).
+    Bulk version of add_document for ingesting a knowledge base.
+    Texts are embedded in batches of `batch_size` (one API request each), with
+    up to `max_concurrency` requests in flight; documents are stored in input order.
+    Per-document ids/sources/extra metadata are given as lists parallel to `texts`
+    (ValueError if a given list's length differs).
     """
-    seen = []
-    lines = []
-    idx_map = {}
-    i = 1
-    for r in results:
-        m = r.get("metadata", {})
-        key = (m.get("source"), m.get("id"))
-        if key not in seen:
-            seen.append(key)
-            label = f"[{i}]"
-            idx_map[key] = label
-            src = m.get("source") or "unknown source"
-            did = m.get("id") or "-"
-            lines.append(f"{label} {src} (id: {did})")
-            i += 1
-    return "\n".join(lines), idx_map
+    return asyncio.run(
+        aadd_documents(texts, doc_ids, sources, extra_metas, batch_size, max_concurrency)
+    )
+
+
+async def aadd_documents(
+    texts: List[str],
+    doc_ids: Optional[List[Optional[str]]] = None,
+    sources: Optional[List[Optional[str]]] = None,
+    extra_metas: Optional[List[Optional[Dict]]] = None,
+    batch_size: int = 512,
+    max_concurrency: int = 5,
+):
+    """
+    Async form of add_documents, for callers already running an event loop.
+    """
+    # Check before embedding anything: a mismatch would silently drop documents or metadata
+    for name, values in (("doc_ids", doc_ids), ("sources", sources), ("extra_metas", extra_metas)):
+        if values is not None and len(values) != len(texts):
+            raise ValueError(
+                f"{name} has {len(values)} entries but texts has {len(texts)}; "
+                "they must be parallel lists."
+            )
+
+    try:
+        from . import vector_store  # type: ignore
+    except Exception:
+        import vector_store  # type: ignore
+
+    embeddings = _embeddings()
+    semaphore = asyncio.Semaphore(max_concurrency)
+
+    async def _fetch(chunk: List[str]) -> List[np.ndarray]:
+        async with semaphore:
+            return await asyncio.to_thread(embeddings.generate_embeddings_batch, chunk, batch_size)
+
+    chunks = [texts[i:i + batch_size] for i in range(0, len(texts), batch_size)]
+    # gather keeps results in submission order, so flattening restores input order
+    batches = await asyncio.gather(*[_fetch(c) for c in chunks])
+    embs = [emb for batch in batches for emb in batch]
+
+    for i, (text, emb) in enumerate(zip(texts, embs)):
+        meta = {
+            "id": doc_ids[i] if doc_ids else None,
+            "source": sources[i] if sources else None,
+            "content": text,
+        }
+        if extra_metas and extra_metas[i]:
+            meta.update(extra_metas[i])
+        vector_store.add_document_embedding(_normalize(emb), meta, normalized=True)
+
+
+def _normalize(vec) -> np.ndarray:
+    """
+    Return `vec` as a unit-length float32 array, so cosine similarity against
+    other unit vectors is just a dot product.
+    """
+    v = np.asarray(vec, dtype=np.float32)
+    return v / (np.linalg.norm(v) + 1e-12)
 
 
 def build_context_from_results(results: List[Dict]) -> str:
     """
     Format retrieved search results into a context block for prompting.
     Each chunk gets a lightweight citation tag like [1], [2] based on source list.
+
+    Tags and the 'Sources' block (deduped by (source, id), numbered in
+    first-seen order) are produced in the same pass as the chunks.
     """
-    sources_block, idx_map = _format_source_list(results)
-    parts = []
-    for r in results:
+    buf = io.StringIO()
+    buf.write("Retrieved Context (top matches):\n\n")
+    idx_map = {}  # (source, id) -> "[n]"
+    source_lines = []
+    for n, r in enumerate(results):
         m = r.get("metadata", {})
         key = (m.get("source"), m.get("id"))
-        tag = idx_map.get(key, "[?]")
+        tag = idx_map.get(key)
+        if tag is None:
+            tag = f"[{len(idx_map) + 1}]"
+            idx_map[key] = tag
+            src = m.get("source") or "unknown source"
+            did = m.get("id") or "-"
+            source_lines.append(f"{tag} {src} (id: {did})")
         snippet = (m.get("content") or "").strip()
         score = r.get("score")
-        header = f"{tag} Score={score:.4f}" if isinstance(score, (int, float)) else f"{tag}"
-        parts.append(f"{header}\n{snippet}")
-    chunks = "\n\n---\n\n".join(parts) if parts else "(no relevant context found)"
+        if n:
+            buf.write("\n\n---\n\n")
+        buf.write(f"{tag} Score={score:.4f}" if isinstance(score, (int, float)) else tag)
+        buf.write("\n")
+        buf.write(snippet)
+    if not results:
+        buf.write("(no relevant context found)")
 
-    context = f"Retrieved Context (top matches):\n\n{chunks}\n\nSources:\n{sources_block or '(none)'}"
-    return context
+    buf.write("\n\nSources:\n")
+    buf.write("\n".join(source_lines) or "(none)")
+    return buf.getvalue()
 
 
 def query_with_rag(
@@ -112,15 +203,21 @@ def query_with_rag(
     top_k: int = 3,
     output_format: Optional[str] = "Markdown",
     use_openai: bool = False,
+    no_cache: bool = False,
 ) -> Dict[str, str]:
     """
     Run a query through the RAG pipeline and return a dict with the prompt & answer.
 
+    Results are cached in-process by a hash of the fully built prompt (query,
+    history, retrieved context and output format), so a repeated request skips
+    the LLM call.
+
     :param user_query: user question
     :param conversation_history: [{'user': str, 'assistant': str}, ...]
     :param top_k: number of retrieved chunks
     :param output_format: e.g. "Markdown", "JSON", "Plain text"
     :param use_openai: pass through to zero_shot_answer (False = offline mock)
+    :param no_cache: skip the answer cache (always call the model)
     :return: {"prompt": str, "answer": str}
     """
     try:
@@ -129,10 +226,10 @@ def query_with_rag(
         import vector_store  # type: ignore
 
     # 1) Embed the query
-    query_emb = _generate_embedding_with_fallback(user_query)
+    query_emb = _normalize(_generate_embedding_with_fallback(user_query))
 
     # 2) Retrieve similar docs
-    results = vector_store.search_similar(query_emb, top_k=top_k) or []
+    results = vector_store.search_similar(query_emb, top_k=top_k, query_is_normalized=True) or []
 
     # 3) Build context from results (with simple citations)
     retrieved_context = build_context_from_results(results)
@@ -145,6 +242,14 @@ def query_with_rag(
         output_format=output_format,
     )
 
+    cache_key = None
+    if not no_cache:
+        cache_key = _answer_cache_key(prompt_text, output_format, use_openai)
+        cached = _answer_cache.get(cache_key)
+        if cached is not None:
+            _answer_cache.move_to_end(cache_key)
+            return dict(cached)
+
     # 5) Get the final answer (mock by default; OpenAI if use_openai=True)
     task_instruction = (
         "Use the retrieved context to answer accurately. "
@@ -159,24 +264,34 @@ def query_with_rag(
         use_openai=use_openai,
     )
 
-    return {"prompt": built_prompt, "answer": answer}
+    result = {"prompt": built_prompt, "answer": answer}
+    # Never cache a fallback: one transient API error must not stick to the query
+    if cache_key is not None and not is_fallback_answer(answer):
+        _answer_cache[cache_key] = dict(result)
+        if len(_answer_cache) > ANSWER_CACHE_SIZE:
+            _answer_cache.popitem(last=False)
+    return result
 
 
-def _generate_embedding_with_fallback(text: str) -> List[float]:
+def _answer_cache_key(prompt_text: str, output_format: Optional[str], use_openai: bool) -> str:
+    raw = f"{use_openai}\x00{output_format}\x00{prompt_text}"
+    return hashlib.sha256(raw.encode("utf-8")).hexdigest()
+
+
+def clear_answer_cache() -> None:
+    _answer_cache.clear()
+
+
+def _generate_embedding_with_fallback(text: str) -> np.ndarray:
     """
     Use OpenAI embeddings if configured; otherwise, return a deterministic
-    pseudo-embedding so the demo can run offline.
+    float32 pseudo-embedding so the demo can run offline.
     """
     import os
     if os.getenv("OPENAI_API_KEY"):
-        return embeddings.generate_embedding(text)
-
-    # Deterministic fallback: hash to vector of fixed size
-    import hashlib
-    import random
-    h = hashlib.sha256(text.encode("utf-8")).hexdigest()
-    rng = random.Random(int(h[:8], 16))
-    return [rng.uniform(-1.0, 1.0) for _ in range(128)]
+        return _embeddings().generate_embedding(text)
+
+    return hash_embedding(text)
 
 
 # --- Standalone smoke test ---
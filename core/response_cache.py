@@ -0,0 +1,55 @@
+"""
+core/response_cache.py
+======================
+Content-addressed on-disk cache for LLM responses.
+
+A chat completion is a function of (model, messages, sampling params), so its
+text can be stored under a hash of exactly those inputs; repeated prompts (e.g.
+the hard-coded demo prompts) then return from local disk instead of paying a
+network round-trip. Only real API responses are cached, never dummy/fallback text.
+
+Requires `diskcache`; without it (or with LLM_CACHE=0) every lookup misses.
+"""
+
+from typing import Optional
+import hashlib
+import json
+import os
+
+try:
+    import diskcache  # type: ignore
+except ImportError:
+    diskcache = None  # type: ignore
+
+LLM_CACHE_DIR = os.getenv("LLM_CACHE_DIR", ".llm_cache")
+LLM_CACHE_ENABLED = os.getenv("LLM_CACHE", "1") != "0"
+
+_cache = None
+
+
+def _get_cache():
+    global _cache
+    if _cache is None and diskcache is not None and LLM_CACHE_ENABLED:
+        _cache = diskcache.Cache(LLM_CACHE_DIR)
+    return _cache
+
+
+def cache_key(model: str, messages, params: Optional[dict] = None) -> str:
+    """Stable hash of everything that determines the completion."""
+    payload = json.dumps(
+        {"model": model, "messages": messages, "params": params or {}},
+        sort_keys=True,
+        default=str,
+    )
+    return hashlib.blake2b(payload.encode("utf-8"), digest_size=32).hexdigest()
+
+
+def get_cached(key: str) -> Optional[str]:
+    cache = _get_cache()
+    return cache.get(key) if cache is not None else None
+
+
+def put_cached(key: str, text: str) -> None:
+    cache = _get_cache()
+    if cache is not None:
+        cache.set(key, text)
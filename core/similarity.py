@@ -16,17 +16,31 @@ Use-cases in CryptoInsightAI:
 """
 
 import os
-import openai
-from dotenv import load_dotenv
+import sys
+import json
+import time
+import asyncio
+from typing import Iterator
 
-# Load API Key
-load_dotenv()
-OPENAI_API_KEY = os.getenv("OPENAI_API_KEY")
-USE_OPENAI = bool(OPENAI_API_KEY)
+# Ensure local imports work when executed as a script from project root
+CURRENT_DIR = os.path.dirname(os.path.abspath(__file__))
+if CURRENT_DIR not in sys.path:
+    sys.path.insert(0, CURRENT_DIR)
+
+try:
+    # Package import
+    from . import response_cache  # type: ignore
+    from ._client import get_client, get_async_client, close_async_client  # type: ignore
+except Exception:
+    # Script import
+    import response_cache  # type: ignore
+    from _client import get_client, get_async_client, close_async_client  # type: ignore
 
-# Configure OpenAI client
-if USE_OPENAI:
-    openai.api_key = OPENAI_API_KEY
+OPENAI_API_KEY = os.getenv("OPENAI_API_KEY")  # .env loaded by _client
+USE_OPENAI = bool(OPENAI_API_KEY)
+MAX_CONCURRENT_REQUESTS = int(os.getenv("OPENAI_MAX_CONCURRENCY", "8"))
+USE_BATCH = os.getenv("USE_BATCH") == "1"
+BATCH_POLL_SECONDS = 30
 
 
 def _generate_dummy_text(prompt, generation_config):
@@ -34,10 +48,8 @@ def _generate_dummy_text(prompt, generation_config):
     Returns deterministic dummy output based on the provided generation config.
     Ensures terminal output even when API is unavailable.
     """
-    temperature = generation_config.get("temperature")
+    # Keys are looked up only until one is set (top_k, then top_p, then temperature)
     top_k = generation_config.get("top_k")
-    top_p = generation_config.get("top_p")
-
     if top_k is not None:
         return (
             f"[Dummy Top-K Output]\n"
@@ -46,6 +58,7 @@ def _generate_dummy_text(prompt, generation_config):
             f"Sample: This is a concise response constrained to the top {top_k} probable tokens."
         )
 
+    top_p = generation_config.get("top_p")
     if top_p is not None:
         return (
             f"[Dummy Top-P Output]\n"
@@ -54,8 +67,9 @@ def _generate_dummy_text(prompt, generation_config):
             f"Sample: This response explores tokens until cumulative probability ≥ {top_p}."
         )
 
+    temperature = generation_config.get("temperature")
     if temperature is not None:
-        style = "factual" if (temperature is not None and temperature <= 0.3) else "creative"
+        style = "factual" if temperature <= 0.3 else "creative"
         return (
             f"[Dummy Temperature Output]\n"
             f"Temperature = {temperature}\n"
@@ -79,22 +93,220 @@ def call_openai_with_config(prompt, generation_config):
     if not USE_OPENAI:
         return _generate_dummy_text(prompt, generation_config)
 
+    messages = [{"role": "user", "content": prompt}]
+    key = response_cache.cache_key("gpt-3.5-turbo", messages, generation_config)
+    cached = response_cache.get_cached(key)
+    if cached is not None:
+        return cached
+
     try:
-        response = openai.ChatCompletion.create(
+        response = get_client().chat.completions.create(
             model="gpt-3.5-turbo",
-            messages=[
-                {"role": "user", "content": prompt}
-            ],
+            messages=messages,
             **generation_config
         )
         
-        return response.choices[0].message.content.strip()
+        text = response.choices[0].message.content.strip()
+        response_cache.put_cached(key, text)
+        return text
     
     except Exception as e:
         # Fallback to dummy output to guarantee terminal output
         return _generate_dummy_text(prompt, generation_config)
 
 
+async def acall_openai_with_config(prompt, generation_config):
+    """
+    Async version of call_openai_with_config, so many calls can be in flight at once.
+    """
+    if not USE_OPENAI:
+        return _generate_dummy_text(prompt, generation_config)
+
+    messages = [{"role": "user", "content": prompt}]
+    key = response_cache.cache_key("gpt-3.5-turbo", messages, generation_config)
+    cached = response_cache.get_cached(key)
+    if cached is not None:
+        return cached
+
+    try:
+        response = await get_async_client().chat.completions.create(
+            model="gpt-3.5-turbo",
+            messages=messages,
+            **generation_config
+        )
+        text = response.choices[0].message.content.strip()
+        response_cache.put_cached(key, text)
+        return text
+    except RuntimeError:
+        # Event-loop misuse (e.g. a client from a closed loop) is a bug, not an outage
+        raise
+    except Exception:
+        # Fallback to dummy output to guarantee terminal output
+        return _generate_dummy_text(prompt, generation_config)
+
+
+def stream_openai(prompt, generation_config) -> Iterator[str]:
+    """
+    Streaming version of call_openai_with_config: yields text deltas as the
+    model produces them, so the first words arrive after ~one token instead of
+    after the whole completion. Cached/dummy output is yielded in one piece.
+    """
+    if not USE_OPENAI:
+        yield _generate_dummy_text(prompt, generation_config)
+        return
+
+    messages = [{"role": "user", "content": prompt}]
+    key = response_cache.cache_key("gpt-3.5-turbo", messages, generation_config)
+    cached = response_cache.get_cached(key)
+    if cached is not None:
+        yield cached
+        return
+
+    parts = []
+    try:
+        stream = get_client().chat.completions.create(
+            model="gpt-3.5-turbo",
+            messages=messages,
+            stream=True,
+            **generation_config
+        )
+        try:
+            for chunk in stream:
+                delta = chunk.choices[0].delta.content if chunk.choices else None
+                if delta:
+                    parts.append(delta)
+                    yield delta
+        finally:
+            stream.close()
+    except Exception:
+        # Nothing sent yet -> fall back to dummy output; otherwise keep what was streamed
+        if not parts:
+            yield _generate_dummy_text(prompt, generation_config)
+        return
+
+    response_cache.put_cached(key, "".join(parts).strip())
+
+
+def call_openai_with_config_multi(prompt, generation_configs):
+    """
+    Get one completion of `prompt` per config, in the order given.
+    If every config is identical, a single request with n=len(configs) returns
+    all samples in one round-trip (the prompt is sent and prefilled once);
+    otherwise the calls are issued concurrently.
+    Not for use inside a running event loop (use acall_openai_with_config there).
+    """
+    configs = list(generation_configs)
+    if not configs:
+        return []
+    if not USE_OPENAI:
+        return [_generate_dummy_text(prompt, cfg) for cfg in configs]
+
+    if all(cfg == configs[0] for cfg in configs[1:]):
+        # Not cached: callers asking for n samples want n independent draws
+        try:
+            response = get_client().chat.completions.create(
+                model="gpt-3.5-turbo",
+                messages=[{"role": "user", "content": prompt}],
+                n=len(configs),
+                **configs[0]
+            )
+            choices = sorted(response.choices, key=lambda c: c.index)
+            return [choice.message.content.strip() for choice in choices]
+        except Exception:
+            return [_generate_dummy_text(prompt, cfg) for cfg in configs]
+
+    return run_limited([acall_openai_with_config(prompt, cfg) for cfg in configs])
+
+
+async def gather_limited(coros, max_concurrency=MAX_CONCURRENT_REQUESTS):
+    """
+    Await coroutines concurrently with at most `max_concurrency` running at a time.
+    Results are returned in the order the coroutines were given.
+    """
+    semaphore = asyncio.Semaphore(max_concurrency)
+
+    async def _run(coro):
+        async with semaphore:
+            return await coro
+
+    return await asyncio.gather(*(_run(c) for c in coros))
+
+
+def run_limited(coros, max_concurrency=MAX_CONCURRENT_REQUESTS):
+    """
+    Sync entry point for gather_limited: runs the coroutines on a fresh event
+    loop and closes that loop's async client before the loop is torn down.
+    """
+    async def _main():
+        try:
+            return await gather_limited(coros, max_concurrency)
+        finally:
+            await close_async_client()
+
+    return asyncio.run(_main())
+
+
+# ------------------------
+# Batch API (offline / bulk runs)
+# ------------------------
+def submit_batch(prompts_and_configs, model="gpt-3.5-turbo"):
+    """
+    Submit many chat completions as one OpenAI Batch API job (half the cost of
+    live calls, separate rate limits; results arrive within 24h).
+
+    :param prompts_and_configs: list of (prompt, generation_config) tuples.
+    :return: batch id, to pass to wait_for_batch.
+    """
+    lines = []
+    for i, (prompt, generation_config) in enumerate(prompts_and_configs):
+        lines.append(json.dumps({
+            "custom_id": f"request-{i}",
+            "method": "POST",
+            "url": "/v1/chat/completions",
+            "body": {
+                "model": model,
+                "messages": [{"role": "user", "content": prompt}],
+                **generation_config,
+            },
+        }))
+    batch_file = get_client().files.create(
+        file=("batch.jsonl", "\n".join(lines).encode("utf-8")),
+        purpose="batch",
+    )
+    batch = get_client().batches.create(
+        input_file_id=batch_file.id,
+        endpoint="/v1/chat/completions",
+        completion_window="24h",
+    )
+    return batch.id
+
+
+def wait_for_batch(batch_id, poll_seconds=BATCH_POLL_SECONDS):
+    """
+    Poll a batch until it finishes and return its outputs in submission order.
+    Requests that failed inside the batch come back as None.
+    """
+    while True:
+        batch = get_client().batches.retrieve(batch_id)
+        if batch.status == "completed":
+            break
+        if batch.status in ("failed", "expired", "cancelled"):
+            raise RuntimeError(f"Batch {batch_id} ended with status '{batch.status}'.")
+        time.sleep(poll_seconds)
+
+    outputs = {}
+    if batch.output_file_id:
+        for line in get_client().files.content(batch.output_file_id).text.splitlines():
+            if not line.strip():
+                continue
+            record = json.loads(line)
+            body = (record.get("response") or {}).get("body") or {}
+            choices = body.get("choices") or []
+            if choices:
+                outputs[record["custom_id"]] = choices[0]["message"]["content"].strip()
+    return [outputs.get(f"request-{i}") for i in range(batch.request_counts.total)]
+
+
 # ------------------------
 # Temperature Control
 # ------------------------
@@ -140,23 +352,64 @@ def generate_with_top_p(prompt, top_p=0.9):
     )
 
 
+async def agenerate_with_temperature(prompt, temperature=1.0):
+    """Async version of generate_with_temperature."""
+    return await acall_openai_with_config(prompt, generation_config={"temperature": temperature})
+
+
+async def agenerate_with_top_k(prompt, top_k=40):
+    """Async version of generate_with_top_k."""
+    return await acall_openai_with_config(prompt, generation_config={"top_k": top_k})
+
+
+async def agenerate_with_top_p(prompt, top_p=0.9):
+    """Async version of generate_with_top_p."""
+    return await acall_openai_with_config(prompt, generation_config={"top_p": top_p})
+
+
 # ------------------------
 # Demo Runs for CryptoInsightAI
 # ------------------------
-if __name__ == "__main__":
+def _run_demo():
     test_prompt_temp = "Give a short market summary for Bitcoin and Ethereum."
+    test_prompt_topk = "Explain the potential impact of blockchain on traditional banking."
+    test_prompt_topp = "Predict the role of AI in cryptocurrency trading over the next 5 years."
+
+    # All six calls are independent
+    requests = [
+        (test_prompt_temp, {"temperature": 0.2}),
+        (test_prompt_temp, {"temperature": 0.8}),
+        (test_prompt_topk, {"top_k": 10}),
+        (test_prompt_topk, {"top_k": 80}),
+        (test_prompt_topp, {"top_p": 0.3}),
+        (test_prompt_topp, {"top_p": 0.9}),
+    ]
+    if USE_OPENAI and USE_BATCH:
+        # Bulk mode: one Batch API job instead of six live calls
+        outputs = wait_for_batch(submit_batch(requests))
+        outputs = [
+            out if out is not None else _generate_dummy_text(prompt, cfg)
+            for out, (prompt, cfg) in zip(outputs, requests)
+        ]
+    else:
+        # Live mode: issue the calls concurrently
+        outputs = run_limited(
+            [acall_openai_with_config(prompt, cfg) for prompt, cfg in requests]
+        )
+    (temp_low, temp_high, topk_low, topk_high, topp_low, topp_high) = outputs
+
     print("\n--- TEMPERATURE CONTROL ---")
-    print("Temperature 0.2 (deterministic):\n", generate_with_temperature(test_prompt_temp, 0.2))
-    print("\nTemperature 0.8 (creative):\n", generate_with_temperature(test_prompt_temp, 0.8))
+    print("Temperature 0.2 (deterministic):\n", temp_low)
+    print("\nTemperature 0.8 (creative):\n", temp_high)
 
-    test_prompt_topk = "Explain the potential impact of blockchain on traditional banking."
     print("\n--- TOP-K CONTROL ---")
-    print("Top-K 10 (focused):\n", generate_with_top_k(test_prompt_topk, 10))
-    print("\nTop-K 80 (diverse):\n", generate_with_top_k(test_prompt_topk, 80))
+    print("Top-K 10 (focused):\n", topk_low)
+    print("\nTop-K 80 (diverse):\n", topk_high)
 
-    test_prompt_topp = "Predict the role of AI in cryptocurrency trading over the next 5 years."
     print("\n--- TOP-P CONTROL ---")
-    print("Top-P 0.3 (precise):\n", generate_with_top_p(test_prompt_topp, 0.3))
-    print("\nTop-P 0.9 (speculative):\n", generate_with_top_p(test_prompt_topp, 0.9))
+    print("Top-P 0.3 (precise):\n", topp_low)
+    print("\nTop-P 0.9 (speculative):\n", topp_high)
 
-   
\ No newline at end of file
+
+if __name__ == "__main__":
+    _run_demo()
@@ -12,32 +12,61 @@ Useful for:
 - Ensuring clean integration in downstream workflows.
 """
 
+from functools import lru_cache
+from typing import Iterator, Optional, Tuple
 import os
-import openai
-from dotenv import load_dotenv
-
-# Load API Key from .env
-load_dotenv()
-OPENAI_API_KEY = os.getenv("OPENAI_API_KEY")
+import re
+import sys
+
+# Ensure local imports work when executed as a script from project root
+CURRENT_DIR = os.path.dirname(os.path.abspath(__file__))
+if CURRENT_DIR not in sys.path:
+    sys.path.insert(0, CURRENT_DIR)
+
+try:
+    # Package import
+    from . import response_cache  # type: ignore
+    from ._client import get_client, get_async_client  # type: ignore
+except Exception:
+    # Script import
+    import response_cache  # type: ignore
+    from _client import get_client, get_async_client  # type: ignore
+
+OPENAI_API_KEY = os.getenv("OPENAI_API_KEY")  # .env loaded by _client
 USE_OPENAI = bool(OPENAI_API_KEY)
 
-# Configure OpenAI client
-if USE_OPENAI:
-    openai.api_key = OPENAI_API_KEY
-
-
 # ------------------------
 # Helpers: Dummy + Stop Apply
 # ------------------------
+_DEFAULT_STOPS: Tuple[str, ...] = ("END", "---")
+
+
+@lru_cache(maxsize=128)
+def _stop_matcher(stops: Tuple[str, ...]) -> Tuple[Optional["re.Pattern[str]"], int, int]:
+    """
+    Validate and dedupe a stop list once per distinct list.
+    Returns (regex, shortest, longest): one alternation of all markers, so a
+    single scan finds the earliest hit, plus the marker length bounds.
+    Empty markers are dropped; with none left the regex is None.
+    """
+    for s in stops:
+        if not isinstance(s, str):
+            raise TypeError(f"Stop sequences must be strings, got {type(s).__name__}.")
+    uniq = tuple(dict.fromkeys(s for s in stops if s))
+    if not uniq:
+        return None, 0, 0
+    lengths = [len(s) for s in uniq]
+    return re.compile("|".join(map(re.escape, uniq))), min(lengths), max(lengths)
+
+
 def _truncate_at_stop_sequences(text: str, stop_sequences):
     if not stop_sequences:
         return text
-    earliest = len(text)
-    for stop in stop_sequences:
-        idx = text.find(stop)
-        if idx != -1:
-            earliest = min(earliest, idx)
-    return text[:earliest]
+    pattern, shortest, _ = _stop_matcher(tuple(stop_sequences))
+    if pattern is None or len(text) < shortest:
+        return text
+    m = pattern.search(text)
+    return text[:m.start()] if m else text
 
 
 def _dummy_stop_output(prompt: str, stop_sequences):
@@ -53,35 +82,132 @@ def _dummy_stop_output(prompt: str, stop_sequences):
 # ------------------------
 # Stop Sequence Generator
 # ------------------------
-def generate_with_stop_sequence(prompt, stop_sequences):
+def generate_with_stop_sequence(prompt, stop_sequences=_DEFAULT_STOPS):
     """
     Generates text with stop sequences using OpenAI Chat Completions.
 
     :param prompt: The text prompt for the LLM.
-    :param stop_sequences: List of strings where generation will stop.
+    :param stop_sequences: Strings where generation will stop (default: END, ---).
     :return: Truncated response string.
     """
     if not USE_OPENAI:
         return _dummy_stop_output(prompt, stop_sequences)
 
+    messages = [{"role": "user", "content": prompt}]
+    params = {"stop": stop_sequences, "max_tokens": 256, "temperature": 0.7}
+    key = response_cache.cache_key("gpt-3.5-turbo", messages, params)
+    cached = response_cache.get_cached(key)
+    if cached is not None:
+        return cached
+
     try:
-        response = openai.ChatCompletion.create(
+        response = get_client().chat.completions.create(
             model="gpt-3.5-turbo",
-            messages=[
-                {"role": "user", "content": prompt}
-            ],
+            messages=messages,
             # OpenAI supports a `stop` list for stop sequences
-            stop=stop_sequences,
-            max_tokens=256,
-            temperature=0.7,
+            **params,
         )
         content = response.choices[0].message.content or ""
+        response_cache.put_cached(key, content)
         return content
     except Exception:
         # Fallback ensures terminal output even on API failure
         return _dummy_stop_output(prompt, stop_sequences)
 
 
+async def agenerate_with_stop_sequence(prompt, stop_sequences=_DEFAULT_STOPS):
+    """
+    Async version of generate_with_stop_sequence, so many calls can be in flight at once.
+    """
+    if not USE_OPENAI:
+        return _dummy_stop_output(prompt, stop_sequences)
+
+    messages = [{"role": "user", "content": prompt}]
+    params = {"stop": stop_sequences, "max_tokens": 256, "temperature": 0.7}
+    key = response_cache.cache_key("gpt-3.5-turbo", messages, params)
+    cached = response_cache.get_cached(key)
+    if cached is not None:
+        return cached
+
+    try:
+        response = await get_async_client().chat.completions.create(
+            model="gpt-3.5-turbo",
+            messages=messages,
+            **params,
+        )
+        content = response.choices[0].message.content or ""
+        response_cache.put_cached(key, content)
+        return content
+    except RuntimeError:
+        # Event-loop misuse (e.g. a client from a closed loop) is a bug, not an outage
+        raise
+    except Exception:
+        # Fallback ensures terminal output even on API failure
+        return _dummy_stop_output(prompt, stop_sequences)
+
+
+def stream_with_stop_sequence(prompt, stop_sequences=_DEFAULT_STOPS) -> Iterator[str]:
+    """
+    Streaming version of generate_with_stop_sequence. Text is yielded as it
+    arrives, and the stream is closed as soon as a stop marker is seen locally,
+    so no further tokens are waited on (or billed).
+    """
+    if not USE_OPENAI:
+        yield _dummy_stop_output(prompt, stop_sequences)
+        return
+
+    messages = [{"role": "user", "content": prompt}]
+    params = {"stop": stop_sequences, "max_tokens": 256, "temperature": 0.7}
+    key = response_cache.cache_key("gpt-3.5-turbo", messages, params)
+    cached = response_cache.get_cached(key)
+    if cached is not None:
+        yield cached
+        return
+
+    pattern, _, longest = _stop_matcher(tuple(stop_sequences or ()))
+    # A marker can straddle two deltas: hold back its length - 1 trailing chars
+    keep = max(longest - 1, 0)
+    parts = []
+    pending = ""
+    try:
+        stream = get_client().chat.completions.create(
+            model="gpt-3.5-turbo",
+            messages=messages,
+            stream=True,
+            **params,
+        )
+        try:
+            for chunk in stream:
+                delta = chunk.choices[0].delta.content if chunk.choices else None
+                if not delta:
+                    continue
+                pending += delta
+                m = pattern.search(pending) if pattern else None
+                if m:
+                    pending = pending[:m.start()]
+                    break
+                cut = len(pending) - keep
+                if cut > 0:
+                    parts.append(pending[:cut])
+                    pending = pending[cut:]
+                    yield parts[-1]
+        finally:
+            stream.close()
+    except Exception:
+        # Nothing sent yet -> fall back to dummy output; otherwise keep what was
+        # streamed, including the held-back tail (not cached: output is partial)
+        if not parts:
+            yield _dummy_stop_output(prompt, stop_sequences)
+        elif pending:
+            yield pending
+        return
+
+    if pending:
+        parts.append(pending)
+        yield pending
+    response_cache.put_cached(key, "".join(parts))
+
+
 # ------------------------
 # Demo Runs
 # ------------------------
@@ -93,4 +219,4 @@ if __name__ == "__main__":
     )
 
     print("\n--- STOP SEQUENCE DEMO ---")
-    print(generate_with_stop_sequence(prompt_text, ["END", "---"]))
+    print(generate_with_stop_sequence(prompt_text, _DEFAULT_STOPS))
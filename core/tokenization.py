@@ -6,10 +6,38 @@ Uses Hugging Face's GPT-2 tokenizer to show how text is split into tokens
 and how token counts are computed.
 """
 
-from transformers import AutoTokenizer
+from functools import lru_cache
+from typing import List
+import os
 
-# Load GPT-2 tokenizer (commonly used for demonstration of subword tokenization)
-tokenizer = AutoTokenizer.from_pretrained("gpt2")
+# Let the Rust tokenizer use all cores for batch calls, and keep transformers quiet.
+# setdefault: explicit user settings win.
+os.environ.setdefault("TOKENIZERS_PARALLELISM", "true")
+os.environ.setdefault("TRANSFORMERS_NO_ADVISORY_WARNINGS", "1")
+
+
+@lru_cache(maxsize=1)
+def _tok():
+    """
+    Load GPT-2 tokenizer (commonly used for demonstration of subword tokenization)
+    on first use: importing transformers and loading the vocab is slow, so
+    importing this module stays cheap for callers that never tokenize.
+    The Rust-backed "fast" tokenizer is required: counting and batching go
+    straight to its backend without building Python id lists.
+    """
+    from transformers import AutoTokenizer
+
+    tok = AutoTokenizer.from_pretrained("gpt2", use_fast=True)
+    if not tok.is_fast:
+        raise RuntimeError("GPT-2 fast tokenizer unavailable; install the `tokenizers` package.")
+    return tok
+
+
+def __getattr__(name: str):
+    # Keep `tokenization.tokenizer` working without loading it at import time
+    if name == "tokenizer":
+        return _tok()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 
 def get_tokens(text: str):
@@ -18,7 +46,18 @@ def get_tokens(text: str):
     :param text: str - Input sentence/paragraph
     :return: list of tokens
     """
-    return tokenizer.tokenize(text)
+    return _tok().tokenize(text)
+
+
+def get_tokens_batch(texts: List[str]) -> List[List[str]]:
+    """
+    Return the token list for each input text, tokenizing the whole batch in
+    one call to the Rust tokenizer.
+    :param texts: list of str - Input sentences/paragraphs
+    :return: list of token lists, in input order
+    """
+    encodings = _tok().backend_tokenizer.encode_batch(texts, add_special_tokens=False)
+    return [enc.tokens for enc in encodings]
 
 
 def count_tokens(text: str) -> int:
@@ -27,7 +66,18 @@ def count_tokens(text: str) -> int:
     :param text: str - Input sentence/paragraph
     :return: int - token count
     """
-    return len(tokenizer.encode(text))
+    return len(_tok().backend_tokenizer.encode(text, add_special_tokens=False))
+
+
+def count_tokens_batch(texts: List[str]) -> List[int]:
+    """
+    Return the token count for each input text. The whole list goes to the
+    Rust tokenizer in one call, which releases the GIL and encodes in parallel.
+    :param texts: list of str - Input sentences/paragraphs
+    :return: list of int token counts, in input order
+    """
+    encodings = _tok().backend_tokenizer.encode_batch(texts, add_special_tokens=False)
+    return [len(enc) for enc in encodings]
 
 
 if __name__ == "__main__":
@@ -35,3 +85,4 @@ if __name__ == "__main__":
     print("📌 Text:", sample_text)
     print("🔹 Tokens:", get_tokens(sample_text))
     print("🔢 Number of tokens:", count_tokens(sample_text))
+    print("🔢 Batch token counts:", count_tokens_batch([sample_text, "Bitcoin and Ethereum"]))
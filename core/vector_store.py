@@ -3,39 +3,286 @@ core/vector_store.py
 ====================
 Minimal in-memory vector store for demos. Stores embeddings with metadata and
 returns cosine-similar results.
+
+Layout is struct-of-arrays: one contiguous (N, D) float32 matrix of embeddings
+plus a parallel list of metadata dicts. Search runs a single matrix-vector
+product over the matrix and only touches metadata for the top-k winners.
+
+Embeddings are stored unit-length, so cosine similarity at query time reduces
+to a plain dot product.
+
+With precision "int8" (see set_precision / VECTOR_STORE_PRECISION), the full
+scan runs against a symmetric int8 copy of the matrix with one scale per row,
+which moves 4x fewer bytes per query; the shortlisted rows are then rescored
+in fp32, so returned scores are exact.
+
+persist(path) / load(path) save the store as `emb.npy` + `meta.jsonl`; load
+memory-maps the matrix read-only, so a restart skips re-embedding and pages
+are read in by the OS on demand (and shared between processes).
 """
 
 from typing import List, Dict, Optional
-import math
+import json
+import os
+import numpy as np
+
+try:
+    import simsimd  # type: ignore
+except ImportError:
+    simsimd = None  # type: ignore
+
+PRECISIONS = ("fp32", "int8")
+_INITIAL_ROWS = 64  # matrix capacity starts here and doubles when full
+_INT8_OVERSAMPLE = 4  # int8 search shortlists this many times top_k before fp32 rescoring
+
+_emb: Optional[np.ndarray] = None     # (capacity, D) float32; rows [:_count] are live
+_meta: List[Dict] = []                # metadata for row i of _emb
+_count = 0
+_qemb: Optional[np.ndarray] = None    # int8 copy of _emb; rows [:_q_count] are current
+_scales: Optional[np.ndarray] = None  # per-row int8 scales
+_q_count = 0
+_precision = os.getenv("VECTOR_STORE_PRECISION", "fp32")
+
+_EMB_FILE = "emb.npy"
+_META_FILE = "meta.jsonl"
+
+
+def _unit(vec) -> np.ndarray:
+    v = np.asarray(vec, dtype=np.float32)
+    return v / (np.linalg.norm(v) + 1e-12)
+
+
+def _quantize(M: np.ndarray):
+    """
+    Symmetric int8 quantization with one scale per row: M ~= Q * scales[:, None].
+    Works on a single vector too (returns a scalar scale).
+    """
+    scales = np.max(np.abs(M), axis=-1, keepdims=True) / 127.0
+    scales[scales == 0] = 1.0
+    Q = np.round(M / scales).astype(np.int8)
+    return Q, scales.squeeze(-1).astype(np.float32)
+
+
+def _int8_scores(Q: np.ndarray, scales: np.ndarray, q: np.ndarray) -> np.ndarray:
+    """Approximate `M @ q` from the int8 copy; a (B, D) batch of queries gives (N, B)."""
+    if q.ndim == 1:
+        return _int8_scores(Q, scales, q[None, :])[:, 0]
+    qq, q_scales = _quantize(q)
+    if simsimd is not None:
+        raw = np.asarray(simsimd.cdist(Q, qq, metric="dot"))
+    else:
+        # Accumulate in int32 without materializing an int32 copy of Q
+        raw = np.einsum("ij,kj->ik", Q, qq, dtype=np.int32)
+    return raw.astype(np.float32) * (scales[:, None] * q_scales[None, :])
 
-_store: List[Dict] = []
+
+def _rank_topk(M: np.ndarray, q: np.ndarray, k: int, scores: Optional[np.ndarray] = None):
+    """
+    Return (indices, scores) of the k best rows of `M @ q`, best first.
+    Uses argpartition so only the k winners get sorted. Pass precomputed
+    `scores` to rank those instead.
+    """
+    if scores is None:
+        scores = M @ q
+    n = scores.shape[0]
+    k = min(k, n)
+    if k <= 0:
+        return np.empty(0, dtype=np.intp), scores
+    if k == n:
+        # Every row is returned: a partition pass would buy nothing
+        return np.argsort(-scores), scores
+    idx = np.argpartition(-scores, k - 1)[:k]
+    idx = idx[np.argsort(-scores[idx])]
+    return idx, scores
+
+
+def _topk_cols(S: np.ndarray, k: int) -> np.ndarray:
+    """Row indices of the k largest entries of each column of S, best first: (k, B)."""
+    n = S.shape[0]
+    k = min(k, n)
+    if k <= 0:
+        return np.empty((0, S.shape[1]), dtype=np.intp)
+    if k == n:
+        return np.argsort(-S, axis=0)
+    idx = np.argpartition(-S, k - 1, axis=0)[:k]
+    order = np.argsort(-np.take_along_axis(S, idx, axis=0), axis=0)
+    return np.take_along_axis(idx, order, axis=0)
+
+
+def _reserve(dim: int) -> None:
+    """
+    Make room for one more row. Capacity doubles when full, so N inserts
+    copy O(N) rows in total.
+    """
+    global _emb
+    if _emb is None:
+        _emb = np.empty((_INITIAL_ROWS, dim), dtype=np.float32)
+    elif _count == _emb.shape[0]:
+        grown = np.empty((2 * _emb.shape[0], dim), dtype=np.float32)
+        grown[:_count] = _emb[:_count]
+        _emb = grown
+
+
+def _quantized():
+    """Return (Q, scales) for the live rows, quantizing only rows added since last time."""
+    global _qemb, _scales, _q_count
+    if _qemb is None or _qemb.shape[0] < _count:
+        qemb = np.empty(_emb.shape, dtype=np.int8)
+        scales = np.empty(_emb.shape[0], dtype=np.float32)
+        if _qemb is not None:
+            qemb[:_q_count] = _qemb[:_q_count]
+            scales[:_q_count] = _scales[:_q_count]
+        _qemb, _scales = qemb, scales
+    if _q_count < _count:
+        _qemb[_q_count:_count], _scales[_q_count:_count] = _quantize(_emb[_q_count:_count])
+        _q_count = _count
+    return _qemb[:_count], _scales[:_count]
+
+
+def set_precision(precision: str) -> None:
+    """
+    Choose the search precision: "fp32" (exact) or "int8" (quantized).
+    """
+    global _precision
+    if precision not in PRECISIONS:
+        raise ValueError(f"Unknown precision {precision!r}; expected one of {PRECISIONS}.")
+    _precision = precision
 
 
 def clear() -> None:
-    _store.clear()
+    global _emb, _count, _qemb, _scales, _q_count
+    _meta.clear()
+    _emb = _qemb = _scales = None
+    _count = _q_count = 0
+
+
+def add_document_embedding(embedding: List[float], metadata: Dict, normalized: bool = False) -> None:
+    """
+    Store an embedding with its metadata.
+    :param normalized: True if the caller already scaled `embedding` to unit length,
+        in which case it is stored as-is instead of being renormalized.
+    """
+    global _count
+    emb = np.asarray(embedding, dtype=np.float32) if normalized else _unit(embedding)
+    if _emb is not None and emb.shape != _emb.shape[1:]:
+        raise ValueError(
+            f"Embedding shape {emb.shape} does not match stored shape {_emb.shape[1:]}."
+        )
+    _reserve(emb.shape[0])
+    _emb[_count] = emb
+    _meta.append(metadata)
+    _count += 1
+
+
+def persist(path: str) -> None:
+    """
+    Write the live rows to `path`/emb.npy and their metadata to `path`/meta.jsonl
+    (one JSON object per line). Metadata must be JSON-serializable.
+    Files are written under temporary names and then renamed, so a store that
+    is currently loaded from `path` stays valid.
+    """
+    os.makedirs(path, exist_ok=True)
+    emb_path = os.path.join(path, _EMB_FILE)
+    meta_path = os.path.join(path, _META_FILE)
+    M = _emb[:_count] if _emb is not None else np.empty((0, 0), dtype=np.float32)
+    with open(emb_path + ".tmp", "wb") as f:
+        np.save(f, M)
+    with open(meta_path + ".tmp", "w", encoding="utf-8") as f:
+        for meta in _meta:
+            f.write(json.dumps(meta, ensure_ascii=False))
+            f.write("\n")
+    os.replace(emb_path + ".tmp", emb_path)
+    os.replace(meta_path + ".tmp", meta_path)
 
 
-def add_document_embedding(embedding: List[float], metadata: Dict) -> None:
-    _store.append({"embedding": embedding, "metadata": metadata})
+def load(path: str) -> None:
+    """
+    Replace the store with the one saved by persist(path). The embedding matrix
+    is memory-mapped read-only; the first insert afterwards copies it into a
+    regular in-memory array (the usual capacity doubling).
+    """
+    global _emb, _count
+    M = np.load(os.path.join(path, _EMB_FILE), mmap_mode="r")
+    with open(os.path.join(path, _META_FILE), encoding="utf-8") as f:
+        metas = [json.loads(line) for line in f if line.strip()]
+    if M.shape[0] != len(metas):
+        raise ValueError(
+            f"{path}: {M.shape[0]} embeddings but {len(metas)} metadata records."
+        )
+    clear()
+    if len(metas):
+        _emb = M
+        _count = len(metas)
+        _meta.extend(metas)
 
 
-def _cosine_similarity(vec_a: List[float], vec_b: List[float]) -> float:
-    if not vec_a or not vec_b or len(vec_a) != len(vec_b):
-        return 0.0
-    dot = sum(a * b for a, b in zip(vec_a, vec_b))
-    norm_a = math.sqrt(sum(a * a for a in vec_a))
-    norm_b = math.sqrt(sum(b * b for b in vec_b))
-    if norm_a == 0 or norm_b == 0:
-        return 0.0
-    return dot / (norm_a * norm_b)
+def normalize_all() -> None:
+    """
+    Rescale every stored row to unit length in one pass, e.g. after bulk inserts
+    with normalized=True whose vectors were only approximately unit length.
+    """
+    global _emb, _q_count
+    if _count == 0:
+        return
+    if not _emb.flags.writeable:
+        _emb = np.array(_emb)  # loaded read-only (mmap): normalize a private copy
+    M = _emb[:_count]
+    M /= np.linalg.norm(M, axis=1, keepdims=True) + 1e-12
+    _q_count = 0  # int8 copy is stale
 
 
-def search_similar(query_embedding: List[float], top_k: int = 3) -> List[Dict]:
-    scored: List[Dict] = []
-    for item in _store:
-        score = _cosine_similarity(query_embedding, item["embedding"])  # type: ignore[index]
-        scored.append({"score": float(score), "metadata": item["metadata"]})
-    scored.sort(key=lambda x: x["score"], reverse=True)
-    return scored[: max(top_k, 0)]
+def search_similar(query_embedding: List[float], top_k: int = 3,
+                   query_is_normalized: bool = False) -> List[Dict]:
+    """
+    Return the top_k stored entries most cosine-similar to the query.
+    :param query_is_normalized: True if the caller already scaled the query to
+        unit length, which skips the norm computation.
+    """
+    if _count == 0:
+        return []
+    M = _emb[:_count]
+    q = np.asarray(query_embedding, dtype=np.float32) if query_is_normalized else _unit(query_embedding)
+    if _precision == "int8" and _INT8_OVERSAMPLE * top_k < _count:
+        # Shortlist on the int8 copy, then rescore only the shortlist exactly in fp32.
+        # (If the shortlist would cover every row, the exact scan alone is cheaper.)
+        Q, scales = _quantized()
+        cand, _ = _rank_topk(M, q, _INT8_OVERSAMPLE * top_k, scores=_int8_scores(Q, scales, q))
+        sub, sub_scores = _rank_topk(M[cand], q, top_k)
+        hits = [(cand[j], sub_scores[j]) for j in sub]
+    else:
+        idx, scores = _rank_topk(M, q, top_k)
+        hits = [(i, scores[i]) for i in idx]
+    return [{"score": float(score), "metadata": _meta[i]} for i, score in hits]
 
 
+def search_similar_batch(query_embeddings, top_k: int = 3,
+                         query_is_normalized: bool = False) -> List[List[Dict]]:
+    """
+    search_similar for a (B, D) batch of queries; returns one result list per query.
+    All queries are scored in a single matrix-matrix product, so the stored
+    matrix is streamed from memory once instead of once per query.
+    """
+    Qf = np.asarray(query_embeddings, dtype=np.float32)
+    if Qf.ndim != 2:
+        raise ValueError(f"Expected a (B, D) array of queries, got shape {Qf.shape}.")
+    if _count == 0:
+        return [[] for _ in range(Qf.shape[0])]
+    if not query_is_normalized:
+        Qf = Qf / (np.linalg.norm(Qf, axis=1, keepdims=True) + 1e-12)
+    M = _emb[:_count]
+    if _precision == "int8" and _INT8_OVERSAMPLE * top_k < _count:
+        # Shortlist each column on the int8 copy, then rescore the shortlists in fp32
+        Q, scales = _quantized()
+        cand = _topk_cols(_int8_scores(Q, scales, Qf), _INT8_OVERSAMPLE * top_k)
+        cand_scores = np.einsum("cbd,bd->cb", M[cand], Qf)
+        order = _topk_cols(cand_scores, top_k)
+        rows = np.take_along_axis(cand, order, axis=0)
+        scores = np.take_along_axis(cand_scores, order, axis=0)
+    else:
+        S = M @ Qf.T
+        rows = _topk_cols(S, top_k)
+        scores = np.take_along_axis(S, rows, axis=0)
+    return [
+        [{"score": float(score), "metadata": _meta[i]} for i, score in zip(rows[:, b], scores[:, b])]
+        for b in range(Qf.shape[0])
+    ]
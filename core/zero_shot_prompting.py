@@ -6,7 +6,6 @@ This file replaces the previous numbered module for simpler imports and executio
 from typing import Tuple
 import os
 import sys
-from dotenv import load_dotenv
 
 # Ensure local imports work when executed as a script from project root
 CURRENT_DIR = os.path.dirname(os.path.abspath(__file__))
@@ -16,12 +15,22 @@ if CURRENT_DIR not in sys.path:
 try:
     # When imported as part of the package
     from .prompting import build_zero_shot_prompt, system_user_prompt  # type: ignore
+    from . import response_cache  # type: ignore
+    from ._client import get_api_key, get_client  # type: ignore
 except Exception:
     # When run as a standalone script
     from prompting import build_zero_shot_prompt, system_user_prompt  # type: ignore
+    import response_cache  # type: ignore
+    from _client import get_api_key, get_client  # type: ignore
+
+# Prefix of the answer returned when use_openai=True but the API call failed
+OPENAI_FALLBACK_PREFIX = "[OpenAI failed or not configured: "
+
+
+def is_fallback_answer(answer_text: str) -> bool:
+    """True if `answer_text` is the mock fallback for a failed/unconfigured OpenAI call."""
+    return answer_text.startswith(OPENAI_FALLBACK_PREFIX)
 
-# Load environment variables from a .env file if present (including OPENAI_API_KEY)
-load_dotenv()
 
 def mock_llm_generate(prompt_text: str) -> str:
     """
@@ -57,39 +66,45 @@ def zero_shot_answer(user_question: str,
 
     if use_openai:
         try:
-            # Prefer modern OpenAI client (openai>=1.0.0)
-            from openai import OpenAI
-
-            api_key = os.getenv("OPENAI_API_KEY")
-            if not api_key:
+            if not get_api_key():
                 raise RuntimeError("OPENAI_API_KEY not set in environment or .env.")
 
-            client = OpenAI(api_key=api_key)
+            client = get_client()
             preferred_model = os.getenv("OPENAI_MODEL", "gpt-4o-mini")
-
-            def _create_completion(model_name: str):
-                return client.chat.completions.create(
+            messages = [
+                {"role": "system", "content": "You are CryptoInsiteAI — answer concisely."},
+                {"role": "user", "content": prompt_text},
+            ]
+            params = {"temperature": 0.0, "max_tokens": 300}
+
+            def _create_completion(model_name: str) -> str:
+                # Same model + messages + params -> same answer; skip the API on a repeat.
+                # Keyed on the model that actually answers, so a fallback-model answer
+                # is never served for the preferred model.
+                key = response_cache.cache_key(model_name, messages, params)
+                cached = response_cache.get_cached(key)
+                if cached is not None:
+                    return cached
+                resp = client.chat.completions.create(
                     model=model_name,
-                    messages=[
-                        {"role": "system", "content": "You are CryptoInsiteAI — answer concisely."},
-                        {"role": "user", "content": prompt_text},
-                    ],
-                    temperature=0.0,
-                    max_tokens=300,
+                    messages=messages,
+                    **params,
                 )
+                text = resp.choices[0].message.content.strip()
+                response_cache.put_cached(key, text)
+                return text
 
             try:
-                resp = _create_completion(preferred_model)
+                text = _create_completion(preferred_model)
             except Exception:
                 # Retry with a safe fallback model name if the preferred one is unavailable
                 fallback_model = "gpt-4o" if preferred_model != "gpt-4o" else preferred_model
-                resp = _create_completion(fallback_model)
+                text = _create_completion(fallback_model)
 
-            text = resp.choices[0].message.content.strip()
             return prompt_text, text
         except Exception as e:
             # If OpenAI isn't available, fallback to mock and notify user in the answer.
-            fallback = f"[OpenAI failed or not configured: {e}]\n\n" + mock_llm_generate(prompt_text)
+            fallback = f"{OPENAI_FALLBACK_PREFIX}{e}]\n\n" + mock_llm_generate(prompt_text)
             return prompt_text, fallback
 
     # default: use mock generator